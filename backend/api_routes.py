@@ -135,6 +135,33 @@ def filtered_articles(
         "pagination": pagination,
     }
 
+@router.post("/articles/filtered/batch")
+def filtered_articles_batch(payload: Dict[str, Any]):
+    # Plusieurs requêtes filtrées en un seul aller-retour HTTP (le client
+    # économise un RTT par variante de tri/filtre)
+    queries = payload.get("queries") or []
+    results = []
+    for i, q in enumerate(queries):
+        if not isinstance(q, dict):
+            raise HTTPException(status_code=400, detail=f"queries[{i}] doit être un objet")
+        try:
+            limit = int(q.get("limit", 50))
+            offset = int(q.get("offset", 0))
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail=f"queries[{i}]: limit/offset invalides")
+        result = filtered_articles(
+            limit=limit,
+            offset=offset,
+            sort_by=q.get("sort_by", "date_desc"),
+            date_start=q.get("date_start"),
+            date_end=q.get("date_end"),
+            source=q.get("source"),
+            search_text=q.get("search_text"),
+        )
+        result["filters_applied"] = dict(q)
+        results.append(result)
+    return {"success": True, "results": results}
+
 @router.get("/search")
 def search(q: str = Query("")):
     db = get_db()